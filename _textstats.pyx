@@ -0,0 +1,61 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+#
+# Optional compiled version of app.compute_text_stats. Build in place with:
+#
+#     cythonize -i _textstats.pyx
+#
+# app.py falls back to its regex implementation when this module is not built.
+# Results must stay identical to that implementation:
+#   - words are the matches of \w+(?:['-]+\w+)*, i.e. each maximal run of word
+#     characters, apostrophes and hyphens with leading/trailing "'" and "-"
+#     removed (runs with no word character are not words);
+#   - sentences are the non-blank pieces of the text split on runs of ".!?".
+
+
+cdef inline bint _is_word_char(Py_UCS4 ch):
+    return ch == u"_" or ch.isalnum()
+
+
+cpdef tuple compute_text_stats(str text):
+    cdef Py_ssize_t n, i = 0, first, last
+    cdef Py_UCS4 ch
+    cdef int words = 0, sentences = 0
+    cdef bint segment_has_text = False
+    cdef set unique = set()
+
+    if text is None:
+        text = ""
+    n = len(text)
+
+    while i < n:
+        ch = text[i]
+        if ch == u"'" or ch == u"-" or _is_word_char(ch):
+            first = -1
+            last = -1
+            while i < n:
+                ch = text[i]
+                if _is_word_char(ch):
+                    if first < 0:
+                        first = i
+                    last = i
+                elif ch != u"'" and ch != u"-":
+                    break
+                i += 1
+            if first >= 0:
+                words += 1
+                unique.add(text[first:last + 1].lower())
+            segment_has_text = True
+            continue
+
+        if ch == u"." or ch == u"!" or ch == u"?":
+            if segment_has_text:
+                sentences += 1
+            segment_has_text = False
+        elif not ch.isspace():
+            segment_has_text = True
+        i += 1
+
+    if segment_has_text:
+        sentences += 1
+
+    return words, sentences, round(len(unique) / words, 3) if words else 0.0
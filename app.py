@@ -1,38 +1,118 @@
 #!/usr/bin/env python3
 import argparse
+import functools
+import gzip
 import json
+import math
+import multiprocessing
 import os
 import re
+import sys
+import threading
 import urllib.parse
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from http import HTTPStatus
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder.
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; paper metrics fall back to pure Python.
+    np = None
+
+
+# Measured costs for a warm parse pool, used to decide when the pool beats parsing serially.
+PARSE_US_PER_FILE = 40.0
+POOL_US_PER_BATCH = 1500.0
+POOL_US_PER_RECORD = 17.0
+
+# Long-lived parse pool, started by main() for the server; None means parse serially.
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+# Smallest folder worth sending to _PARSE_POOL; set together with the pool.
+_PARSE_POOL_MIN_FILES = 0
+
+# Parse results and encoded responses are cached for this many recently used folders.
+MAX_CACHED_FOLDERS = 8
+
+# Least recently used folder first; guarded by _CACHE_LOCK along with each FolderCache's contents.
+_FOLDER_CACHES: "OrderedDict[Path, FolderCache]" = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+
+# Responses smaller than this are sent uncompressed even when the client accepts gzip.
+GZIP_MIN_BYTES = 1024
+
+# Per-review sections of the summary that clients can opt out of with ?fields=.
+REVIEW_SECTIONS: FrozenSet[str] = frozenset({"reviews", "reviewRows"})
+
+# Same matches as \b[\w'-]+\b. Matches start and end on a word character; a run of
+# apostrophes/hyphens not followed by a word character is still tried and backtracked.
+_WORD_RE = re.compile(r"\w+(?:['-]+\w+)*")
+_SENT_RE = re.compile(r"[.!?]+")
 
 
 def normalize_whitespace(text: str) -> str:
-    return re.sub(r"\s+", " ", text or "").strip()
+    # str.split() uses the same whitespace definition as \s, so this matches
+    # re.sub(r"\s+", " ", text).strip() without going through the regex engine.
+    if not text:
+        return ""
+    return " ".join(text.split())
 
 
-def word_count(text: str) -> int:
-    return len(re.findall(r"\b[\w'-]+\b", text or ""))
+def _tokens(text: str) -> List[str]:
+    return _WORD_RE.findall(text or "")
 
 
-def sentence_count(text: str) -> int:
-    parts = re.split(r"[.!?]+", text or "")
-    return len([p for p in parts if p.strip()])
+def _compute_text_stats_py(text: str) -> Tuple[int, int, float]:
+    # Word count, sentence count and unique-word ratio share one tokenization of the text.
+    text = text or ""
+    if text.isascii():
+        # ASCII lowercasing never changes token boundaries, so lower once up front.
+        words = _tokens(text.lower())
+        unique = len(set(words))
+    else:
+        words = _tokens(text)
+        unique = len({w.lower() for w in words})
+    wc = len(words)
+    unique_ratio = unique / wc if wc else 0.0
+    sc = sum(1 for p in _SENT_RE.split(text) if p.strip())
+    return wc, sc, round(unique_ratio, 3)
 
 
-def unique_word_ratio(text: str) -> float:
-    words = [w.lower() for w in re.findall(r"\b[\w'-]+\b", text or "")]
-    if not words:
-        return 0.0
-    return len(set(words)) / len(words)
+try:
+    from _textstats import compute_text_stats
+except ImportError:  # Compiled helper is optional; build it with `cythonize -i _textstats.pyx`.
+    compute_text_stats = _compute_text_stats_py
 
 
-@dataclass
+# Longer texts are rarely repeated verbatim and would mostly bloat the memo table.
+TEXT_STATS_CACHE_MAX_CHARS = 8192
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_text_stats(text: str) -> Tuple[int, int, float]:
+    return compute_text_stats(text)
+
+
+def text_stats(text: str) -> Tuple[int, int, float]:
+    if len(text) < TEXT_STATS_CACHE_MAX_CHARS:
+        return _cached_text_stats(text)
+    return compute_text_stats(text)
+
+
+# Slotted records drop the per-instance __dict__; slots= needs Python 3.10+.
+_RECORD_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_RECORD_OPTIONS)
 class ReviewRecord:
     submission: str
     title: str
@@ -52,6 +132,9 @@ class ReviewRecord:
     unique_word_ratio: float
 
 
+INTERNED_FIELDS = ("submission", "title", "authors", "pc_member", "subreviewer_name", "subreviewer_email")
+
+
 class ReviewParseError(Exception):
     pass
 
@@ -68,11 +151,12 @@ def parse_score(node: Optional[ET.Element]) -> Optional[float]:
         return None
 
 
-def field_by_name(root: ET.Element, name: str) -> Optional[ET.Element]:
-    for field in root.findall("field"):
-        if (field.get("name") or "").strip() == name:
-            return field
-    return None
+def fields_by_name(root: ET.Element) -> Dict[str, ET.Element]:
+    # First field wins when a name repeats, matching a front-to-back lookup.
+    fields: Dict[str, ET.Element] = {}
+    for node in root.findall("field"):
+        fields.setdefault((node.get("name") or "").strip(), node)
+    return fields
 
 
 def parse_review_xml(xml_path: Path) -> ReviewRecord:
@@ -84,16 +168,21 @@ def parse_review_xml(xml_path: Path) -> ReviewRecord:
     root = tree.getroot()
     if root.tag != "review":
         raise ReviewParseError(f"Unexpected root tag in {xml_path.name}: {root.tag}")
+    return review_from_element(root, xml_path)
 
-    submission = (root.get("submission") or "").strip()
-    title = (root.get("title") or "").strip()
-    authors = (root.get("authors") or "").strip()
+
+def review_from_element(root: ET.Element, xml_path: Path) -> ReviewRecord:
+    # Paper and reviewer strings repeat across files; intern them so records share one copy.
+    submission = sys.intern((root.get("submission") or "").strip())
+    title = sys.intern((root.get("title") or "").strip())
+    authors = sys.intern((root.get("authors") or "").strip())
     review_id = (root.get("id") or "").strip()
-    pc_member = (root.get("pc_member") or "").strip()
+    pc_member = sys.intern((root.get("pc_member") or "").strip())
 
-    overall_field = field_by_name(root, "Overall evaluation")
-    confidence_field = field_by_name(root, "Reviewer's confidence")
-    confidential_field = field_by_name(root, "Confidential remarks for the program committee")
+    fields = fields_by_name(root)
+    overall_field = fields.get("Overall evaluation")
+    confidence_field = fields.get("Reviewer's confidence")
+    confidential_field = fields.get("Confidential remarks for the program committee")
 
     overall_text = ""
     overall_score = None
@@ -115,10 +204,12 @@ def parse_review_xml(xml_path: Path) -> ReviewRecord:
     reviewer_node = root.find("reviewer")
     first_name = normalize_whitespace(reviewer_node.findtext("first_name") if reviewer_node is not None else "")
     last_name = normalize_whitespace(reviewer_node.findtext("last_name") if reviewer_node is not None else "")
-    subreviewer_name = normalize_whitespace(f"{first_name} {last_name}")
-    subreviewer_email = normalize_whitespace(reviewer_node.findtext("email") if reviewer_node is not None else "")
+    subreviewer_name = sys.intern(normalize_whitespace(f"{first_name} {last_name}"))
+    subreviewer_email = sys.intern(
+        normalize_whitespace(reviewer_node.findtext("email") if reviewer_node is not None else "")
+    )
 
-    wc = word_count(overall_text)
+    wc, sc, unique_ratio = text_stats(overall_text)
 
     return ReviewRecord(
         submission=submission,
@@ -135,194 +226,406 @@ def parse_review_xml(xml_path: Path) -> ReviewRecord:
         subreviewer_email=subreviewer_email,
         word_count=wc,
         char_count=len(overall_text),
-        sentence_count=sentence_count(overall_text),
-        unique_word_ratio=round(unique_word_ratio(overall_text), 3),
+        sentence_count=sc,
+        unique_word_ratio=unique_ratio,
     )
 
 
-def summarize_reviews(reviews: List[ReviewRecord]) -> Dict[str, object]:
-    reviewer_scores: Dict[str, List[float]] = {}
+def _paper_metrics(
+    group: List[Tuple[ReviewRecord, str]], reviewer_stats: Dict[str, Dict[str, float]]
+) -> Dict[str, object]:
+    scores = [r.overall_score for r, _ in group if r.overall_score is not None]
+    confs = [r.confidence_score for r, _ in group if r.confidence_score is not None]
+    words = [r.word_count for r, _ in group]
 
-    def reviewer_key_for(review: ReviewRecord) -> str:
-        if review.pc_member:
-            return review.pc_member
-        if review.subreviewer_email:
-            return review.subreviewer_email
-        if review.subreviewer_name:
-            return review.subreviewer_name
-        return f"unknown:{review.file_name}"
+    avg_score = round(sum(scores) / len(scores), 3) if scores else None
+    min_score = min(scores) if scores else None
+    max_score = max(scores) if scores else None
+    discrepancy = round((max_score - min_score), 3) if scores else None
+    avg_conf = round(sum(confs) / len(confs), 3) if confs else None
+    avg_words = round(sum(words) / len(words), 1) if words else 0
 
-    for review in reviews:
-        if review.overall_score is None:
-            continue
-        key = reviewer_key_for(review)
-        reviewer_scores.setdefault(key, []).append(review.overall_score)
+    weighted_score_total = 0.0
+    weighted_score_denom = 0.0
+    reviewer_adjusted_scores: List[float] = []
 
-    reviewer_stats: Dict[str, Dict[str, float]] = {}
-    for key, scores in reviewer_scores.items():
-        if not scores:
+    for r, reviewer_key in group:
+        score = r.overall_score
+        if score is None:
             continue
-        mean_score = sum(scores) / len(scores)
-        min_score = min(scores)
-        max_score = max(scores)
-        reviewer_stats[key] = {
-            "mean": mean_score,
-            "min": min_score,
-            "max": max_score,
-            "range": max_score - min_score,
-        }
 
-    papers: Dict[str, Dict[str, object]] = {}
-    review_rows: List[Dict[str, object]] = []
+        confidence = r.confidence_score
+        if confidence is None:
+            confidence_weight = 1.0
+        else:
+            conf_clamped = min(max(float(confidence), 1.0), 5.0)
+            # Confidence 1 -> 1.0x, confidence 5 -> 1.5x
+            confidence_weight = 1.0 + (0.5 * (conf_clamped - 1.0) / 4.0)
+
+        weighted_score_total += score * confidence_weight
+        weighted_score_denom += confidence_weight
+
+        stats = reviewer_stats.get(reviewer_key)
+        if stats:
+            reviewer_range = stats["range"]
+            if reviewer_range > 0:
+                reviewer_adjusted_scores.append((score - stats["mean"]) / reviewer_range)
+            else:
+                reviewer_adjusted_scores.append(0.0)
 
-    for review in reviews:
-        reviewer_key = reviewer_key_for(review)
-        paper = papers.setdefault(
-            review.submission,
-            {
-                "submission": review.submission,
-                "title": review.title,
-                "authors": review.authors,
-                "reviews": [],
-            },
-        )
+    confidence_weighted_score = (
+        round(weighted_score_total / weighted_score_denom, 3) if weighted_score_denom > 0 else None
+    )
+    reviewer_adjusted_score = (
+        round(sum(reviewer_adjusted_scores) / len(reviewer_adjusted_scores), 3)
+        if reviewer_adjusted_scores
+        else None
+    )
+
+    return {
+        "avgScore": avg_score,
+        "minScore": min_score,
+        "maxScore": max_score,
+        "scoreDiscrepancy": discrepancy,
+        "avgConfidence": avg_conf,
+        "avgWordCount": avg_words,
+        "confidenceWeightedScore": confidence_weighted_score,
+        "reviewerAdjustedScore": reviewer_adjusted_score,
+    }
 
-        review_obj = {
-            "fileName": review.file_name,
-            "reviewId": review.review_id,
-            "pcMember": review.pc_member,
-            "overallScore": review.overall_score,
-            "confidenceScore": review.confidence_score,
-            "overallText": review.overall_text,
-            "confidentialText": review.confidential_text,
-            "subreviewerName": review.subreviewer_name,
-            "subreviewerEmail": review.subreviewer_email,
-            "wordCount": review.word_count,
-            "charCount": review.char_count,
-            "sentenceCount": review.sentence_count,
-            "uniqueWordRatio": review.unique_word_ratio,
-            "reviewerKey": reviewer_key,
-        }
-        paper["reviews"].append(review_obj)
 
-        review_rows.append(
+def _paper_metrics_numpy(
+    groups: List[List[Tuple[ReviewRecord, str]]], reviewer_stats: Dict[str, Dict[str, float]]
+) -> List[Dict[str, object]]:
+    # Same metrics as _paper_metrics, computed over flat per-review arrays grouped by paper.
+    # Sums use bincount, which accumulates in review order like the pure-Python loop.
+    if not groups:
+        return []
+    counts = [len(group) for group in groups]
+    rows = [pair for group in groups for pair in group]
+    n = len(groups)
+    paper_index = np.repeat(np.arange(n), counts)
+    starts = np.cumsum([0] + counts[:-1])
+
+    # Only None means missing, as in _paper_metrics; a "nan" score from parse_score is still a score.
+    scored = np.array([r.overall_score is not None for r, _ in rows], dtype=bool)
+    has_conf = np.array([r.confidence_score is not None for r, _ in rows], dtype=bool)
+    scores = np.array([r.overall_score if r.overall_score is not None else 0.0 for r, _ in rows], dtype=float)
+    confs = np.array(
+        [r.confidence_score if r.confidence_score is not None else 1.0 for r, _ in rows], dtype=float
+    )
+    words = np.array([r.word_count for r, _ in rows], dtype=float)
+    reviewer = [reviewer_stats.get(key) for _, key in rows]
+    has_stats = np.array([stats is not None for stats in reviewer], dtype=bool)
+    means = np.array([stats["mean"] if stats else 0.0 for stats in reviewer], dtype=float)
+    ranges = np.array([stats["range"] if stats else 0.0 for stats in reviewer], dtype=float)
+
+    def group_sum(values):
+        return np.bincount(paper_index, weights=values, minlength=n).tolist()
+
+    score_count = group_sum(scored)
+    score_sum = group_sum(scores)
+    score_min = np.minimum.reduceat(np.where(scored, scores, np.inf), starts).tolist()
+    score_max = np.maximum.reduceat(np.where(scored, scores, -np.inf), starts).tolist()
+    conf_count = group_sum(has_conf)
+    conf_sum = group_sum(np.where(has_conf, confs, 0.0))
+    word_sum = group_sum(words)
+
+    # Confidence 1 -> 1.0x, confidence 5 -> 1.5x
+    weights = np.where(has_conf, 1.0 + (0.5 * (np.clip(confs, 1.0, 5.0) - 1.0) / 4.0), 1.0)
+    weighted_total = group_sum(np.where(scored, scores * weights, 0.0))
+    weighted_denom = group_sum(np.where(scored, weights, 0.0))
+
+    adjustable = scored & has_stats
+    with np.errstate(divide="ignore", invalid="ignore"):
+        adjusted = np.where(ranges > 0, (scores - means) / ranges, 0.0)
+    adjusted_count = group_sum(adjustable)
+    adjusted_sum = group_sum(np.where(adjustable, adjusted, 0.0))
+
+    metrics = []
+    for i in range(n):
+        has_scores = score_count[i] > 0
+        metrics.append(
             {
-                "submission": review.submission,
-                "title": review.title,
-                "fileName": review.file_name,
-                "overallScore": review.overall_score,
-                "confidenceScore": review.confidence_score,
-                "wordCount": review.word_count,
-                "charCount": review.char_count,
-                "sentenceCount": review.sentence_count,
-                "uniqueWordRatio": review.unique_word_ratio,
-                "pcMember": review.pc_member,
-                "reviewerKey": reviewer_key,
-                "reviewId": review.review_id,
-                "hasConfidential": bool(review.confidential_text),
+                "avgScore": round(score_sum[i] / score_count[i], 3) if has_scores else None,
+                "minScore": score_min[i] if has_scores else None,
+                "maxScore": score_max[i] if has_scores else None,
+                "scoreDiscrepancy": round(score_max[i] - score_min[i], 3) if has_scores else None,
+                "avgConfidence": round(conf_sum[i] / conf_count[i], 3) if conf_count[i] else None,
+                "avgWordCount": round(word_sum[i] / counts[i], 1),
+                "confidenceWeightedScore": (
+                    round(weighted_total[i] / weighted_denom[i], 3) if weighted_denom[i] > 0 else None
+                ),
+                "reviewerAdjustedScore": (
+                    round(adjusted_sum[i] / adjusted_count[i], 3) if adjusted_count[i] else None
+                ),
             }
         )
+    return metrics
 
-    paper_rows = []
-    for paper in papers.values():
-        rs = paper["reviews"]
-        scores = [r["overallScore"] for r in rs if r["overallScore"] is not None]
-        confs = [r["confidenceScore"] for r in rs if r["confidenceScore"] is not None]
-        words = [r["wordCount"] for r in rs]
-
-        avg_score = round(sum(scores) / len(scores), 3) if scores else None
-        min_score = min(scores) if scores else None
-        max_score = max(scores) if scores else None
-        discrepancy = round((max_score - min_score), 3) if scores else None
-        avg_conf = round(sum(confs) / len(confs), 3) if confs else None
-        avg_words = round(sum(words) / len(words), 1) if words else 0
-
-        weighted_score_total = 0.0
-        weighted_score_denom = 0.0
-        reviewer_adjusted_scores: List[float] = []
-
-        for r in rs:
-            score = r["overallScore"]
-            if score is None:
-                continue
-
-            confidence = r["confidenceScore"]
-            if confidence is None:
-                confidence_weight = 1.0
-            else:
-                conf_clamped = min(max(float(confidence), 1.0), 5.0)
-                # Confidence 1 -> 1.0x, confidence 5 -> 1.5x
-                confidence_weight = 1.0 + (0.5 * (conf_clamped - 1.0) / 4.0)
-
-            weighted_score_total += score * confidence_weight
-            weighted_score_denom += confidence_weight
-
-            reviewer_key = r.get("reviewerKey") or ""
-            stats = reviewer_stats.get(reviewer_key)
-            if stats:
-                reviewer_range = stats["range"]
-                if reviewer_range > 0:
-                    reviewer_adjusted_scores.append((score - stats["mean"]) / reviewer_range)
-                else:
-                    reviewer_adjusted_scores.append(0.0)
-
-        confidence_weighted_score = (
-            round(weighted_score_total / weighted_score_denom, 3) if weighted_score_denom > 0 else None
-        )
-        reviewer_adjusted_score = (
-            round(sum(reviewer_adjusted_scores) / len(reviewer_adjusted_scores), 3)
-            if reviewer_adjusted_scores
-            else None
-        )
 
-        paper_rows.append(
-            {
-                "submission": paper["submission"],
-                "title": paper["title"],
-                "authors": paper["authors"],
-                "reviewCount": len(rs),
-                "avgScore": avg_score,
-                "minScore": min_score,
-                "maxScore": max_score,
-                "scoreDiscrepancy": discrepancy,
-                "avgConfidence": avg_conf,
-                "avgWordCount": avg_words,
-                "confidenceWeightedScore": confidence_weighted_score,
-                "reviewerAdjustedScore": reviewer_adjusted_score,
-                "reviews": rs,
-            }
-        )
+def reviewer_key_for(review: ReviewRecord) -> str:
+    if review.pc_member:
+        return review.pc_member
+    if review.subreviewer_email:
+        return review.subreviewer_email
+    if review.subreviewer_name:
+        return review.subreviewer_name
+    return f"unknown:{review.file_name}"
 
+
+def _review_obj(review: ReviewRecord, reviewer_key: str) -> Dict[str, object]:
     return {
+        "fileName": review.file_name,
+        "reviewId": review.review_id,
+        "pcMember": review.pc_member,
+        "overallScore": review.overall_score,
+        "confidenceScore": review.confidence_score,
+        "overallText": review.overall_text,
+        "confidentialText": review.confidential_text,
+        "subreviewerName": review.subreviewer_name,
+        "subreviewerEmail": review.subreviewer_email,
+        "wordCount": review.word_count,
+        "charCount": review.char_count,
+        "sentenceCount": review.sentence_count,
+        "uniqueWordRatio": review.unique_word_ratio,
+        "reviewerKey": reviewer_key,
+    }
+
+
+def _review_row(review: ReviewRecord, reviewer_key: str) -> Dict[str, object]:
+    return {
+        "submission": review.submission,
+        "title": review.title,
+        "fileName": review.file_name,
+        "overallScore": review.overall_score,
+        "confidenceScore": review.confidence_score,
+        "wordCount": review.word_count,
+        "charCount": review.char_count,
+        "sentenceCount": review.sentence_count,
+        "uniqueWordRatio": review.unique_word_ratio,
+        "pcMember": review.pc_member,
+        "reviewerKey": reviewer_key,
+        "reviewId": review.review_id,
+        "hasConfidential": bool(review.confidential_text),
+    }
+
+
+def summarize_reviews(
+    reviews: List[ReviewRecord], sections: FrozenSet[str] = REVIEW_SECTIONS
+) -> Dict[str, object]:
+    reviewer_keys = [reviewer_key_for(review) for review in reviews]
+    # Running [count, sum, min, max] per reviewer, filled in one pass over the scores.
+    running: Dict[str, List[float]] = {}
+    for review, key in zip(reviews, reviewer_keys):
+        score = review.overall_score
+        if score is None:
+            continue
+        acc = running.get(key)
+        if acc is None:
+            running[key] = [1, score, score, score]
+        else:
+            acc[0] += 1
+            acc[1] += score
+            if score < acc[2]:
+                acc[2] = score
+            if score > acc[3]:
+                acc[3] = score
+
+    reviewer_stats: Dict[str, Dict[str, float]] = {}
+    for key, (count, total, min_score, max_score) in running.items():
+        reviewer_stats[key] = {
+            "mean": total / count,
+            "min": min_score,
+            "max": max_score,
+            "range": max_score - min_score,
+        }
+
+    # Aggregate on the records themselves; the JSON review dicts are only built at the end.
+    paper_reviews: Dict[str, List[Tuple[ReviewRecord, str]]] = {}
+    for review, key in zip(reviews, reviewer_keys):
+        paper_reviews.setdefault(review.submission, []).append((review, key))
+
+    groups = list(paper_reviews.values())
+    if np is not None:
+        metrics = _paper_metrics_numpy(groups, reviewer_stats)
+    else:
+        metrics = [_paper_metrics(group, reviewer_stats) for group in groups]
+
+    paper_rows = []
+    for group, paper_metrics in zip(groups, metrics):
+        first = group[0][0]
+        paper_row = {
+            "submission": first.submission,
+            "title": first.title,
+            "authors": first.authors,
+            "reviewCount": len(group),
+            **paper_metrics,
+        }
+        if "reviews" in sections:
+            paper_row["reviews"] = [_review_obj(review, key) for review, key in group]
+        paper_rows.append(paper_row)
+
+    summary: Dict[str, object] = {
         "paperCount": len(paper_rows),
-        "reviewCount": len(review_rows),
+        "reviewCount": len(reviews),
         "papers": paper_rows,
-        "reviewRows": review_rows,
-        "reviewerCount": len(reviewer_stats),
     }
+    if "reviewRows" in sections:
+        summary["reviewRows"] = [_review_row(review, key) for review, key in zip(reviews, reviewer_keys)]
+    summary["reviewerCount"] = len(reviewer_stats)
+    return summary
+
+
+ParseResult = Tuple[Optional[ReviewRecord], Optional[str]]
+
+
+def _parse_review_or_error(xml_path: Path) -> ParseResult:
+    try:
+        return parse_review_xml(xml_path), None
+    except ReviewParseError as exc:
+        return None, str(exc)
+
+
+def _intern_strings(review: ReviewRecord) -> ReviewRecord:
+    return replace(review, **{name: sys.intern(getattr(review, name)) for name in INTERNED_FIELDS})
+
+
+# (name, mtime_ns, size) of every folder entry, sorted by name.
+FolderSignature = Tuple[Tuple[str, int, int], ...]
+
+
+@dataclass
+class FolderCache:
+    # Parse result per XML file, invalidated by its (mtime_ns, size).
+    parsed: Dict[Path, Tuple[Tuple[int, int], ParseResult]] = field(default_factory=dict)
+    # Encoded /api/reviews response (raw, gzipped) per section set, invalidated by folder_signature().
+    responses: Dict[FrozenSet[str], Tuple[FolderSignature, bytes, Optional[bytes]]] = field(default_factory=dict)
+    # Held while rebuilding a response so concurrent cache misses wait for a single rebuild.
+    # Parsing usually runs in the request thread that holds this lock: the process pool only
+    # exists on multi-core hosts and only takes folders above its size threshold.
+    build_lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _folder_cache(folder: Path) -> FolderCache:
+    with _CACHE_LOCK:
+        cache = _FOLDER_CACHES.get(folder)
+        if cache is None:
+            cache = _FOLDER_CACHES[folder] = FolderCache()
+        _FOLDER_CACHES.move_to_end(folder)
+        while len(_FOLDER_CACHES) > MAX_CACHED_FOLDERS:
+            _FOLDER_CACHES.popitem(last=False)
+        return cache
+
+
+def parallel_parse_min_files(workers: int) -> Optional[int]:
+    # With N files the pool takes about N*file/workers + batch + N*record, so it beats N*file
+    # once N > batch / (file*(1 - 1/workers) - record): ~500 files for 2 workers, ~116 for 4.
+    # None when the per-record overhead eats the whole saving and the pool never wins.
+    saving = PARSE_US_PER_FILE * (1 - 1 / workers) - POOL_US_PER_RECORD
+    if saving <= 0:
+        return None
+    return math.ceil(POOL_US_PER_BATCH / saving)
 
 
-def load_reviews_from_folder(folder: Path) -> Dict[str, object]:
+def start_parse_pool() -> None:
+    global _PARSE_POOL, _PARSE_POOL_MIN_FILES
+    workers = os.cpu_count() or 1
+    min_files = parallel_parse_min_files(workers) if workers >= 2 else None
+    if min_files is None or _PARSE_POOL is not None:
+        return
+    # Request threads submit to this pool, so workers must not be forked from a threaded process:
+    # a forked child can inherit locks held by other threads. forkserver forks from a clean process.
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    _PARSE_POOL = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+    _PARSE_POOL_MIN_FILES = min_files
+
+
+def stop_parse_pool() -> None:
+    global _PARSE_POOL
+    if _PARSE_POOL is not None:
+        _PARSE_POOL.shutdown()
+        _PARSE_POOL = None
+
+
+def _parse_files(xml_files: List[Path]) -> List[ParseResult]:
+    pool = _PARSE_POOL
+    if pool is None or len(xml_files) < _PARSE_POOL_MIN_FILES:
+        return [_parse_review_or_error(xml_file) for xml_file in xml_files]
+
+    chunksize = max(1, len(xml_files) // (4 * (os.cpu_count() or 1)))
+    results = list(pool.map(_parse_review_or_error, xml_files, chunksize=chunksize))
+    # Unpickling does not preserve interning, so re-intern records coming back from workers.
+    return [(_intern_strings(review) if review is not None else None, error) for review, error in results]
+
+
+def _require_folder(folder: Path) -> None:
     if not folder.exists() or not folder.is_dir():
         raise FileNotFoundError(f"Folder not found: {folder}")
 
-    xml_files = sorted([p for p in folder.iterdir() if p.suffix.lower() == ".xml" and p.is_file()])
+
+def _entry_stamp(entry: os.DirEntry) -> Tuple[int, int]:
+    try:
+        stat = entry.stat()
+    except OSError:  # e.g. a dangling symlink; fall back to the link itself
+        stat = entry.stat(follow_symlinks=False)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def folder_signature(folder: Path) -> FolderSignature:
+    # Every entry is keyed, not just the newest mtime: an in-place overwrite that keeps an
+    # older mtime (cp -p, tar -x, backup restores) still changes that file's stamp or size.
+    _require_folder(folder)
+    with os.scandir(folder) as entries:
+        return tuple(sorted((entry.name, *_entry_stamp(entry)) for entry in entries))
+
+
+def load_reviews_from_folder(folder: Path, sections: FrozenSet[str] = REVIEW_SECTIONS) -> Dict[str, object]:
+    _require_folder(folder)
+
+    # One scandir pass lists the folder, filters by name and file type, and stats the survivors.
+    stamps: Dict[Path, Tuple[int, int]] = {}
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            name = entry.name
+            # The length check mirrors Path.suffix, which is empty for a bare ".xml" dotfile.
+            if len(name) > 4 and name.lower().endswith(".xml") and entry.is_file():
+                stat = entry.stat()
+                stamps[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+
+    xml_files = sorted(stamps)
     if not xml_files:
         raise ReviewParseError(f"No XML files found in folder: {folder}")
 
+    cache = _folder_cache(folder)
+    results: Dict[Path, ParseResult] = {}
+    with _CACHE_LOCK:
+        for xml_file in xml_files:
+            entry = cache.parsed.get(xml_file)
+            if entry is not None and entry[0] == stamps[xml_file]:
+                results[xml_file] = entry[1]
+
+    stale = [p for p in xml_files if p not in results]
+    results.update(zip(stale, _parse_files(stale)))
+    with _CACHE_LOCK:
+        # Rebuilding from the current listing also drops files deleted from the folder.
+        cache.parsed = {p: (stamps[p], results[p]) for p in xml_files}
+
     reviews: List[ReviewRecord] = []
     parse_errors = []
 
     for xml_file in xml_files:
-        try:
-            reviews.append(parse_review_xml(xml_file))
-        except ReviewParseError as exc:
-            parse_errors.append(str(exc))
+        review, error = results[xml_file]
+        if review is not None:
+            reviews.append(review)
+        else:
+            parse_errors.append(error)
 
     if not reviews:
         raise ReviewParseError("No valid review XML files could be parsed.")
 
-    data = summarize_reviews(reviews)
+    data = summarize_reviews(reviews, sections)
     data["sourceFolder"] = str(folder)
     data["xmlFiles"] = len(xml_files)
     data["parsedFiles"] = len(reviews)
@@ -330,6 +633,84 @@ def load_reviews_from_folder(folder: Path) -> Dict[str, object]:
     return data
 
 
+def encode_json(payload: Dict[str, object]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    # Parse "coding;q=value" entries. An explicit gzip entry wins over "*", and q=0 means refused.
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+
+def gzip_json(body: bytes) -> Optional[bytes]:
+    if len(body) <= GZIP_MIN_BYTES:
+        return None
+    return gzip.compress(body, compresslevel=1)
+
+
+def parse_sections(value: str) -> FrozenSet[str]:
+    sections = frozenset(name.strip() for name in value.split(",") if name.strip())
+    unknown = sections - REVIEW_SECTIONS
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}. Expected any of: reviews, reviewRows.")
+    return sections
+
+
+def _cached_response(
+    cache: FolderCache, sections: FrozenSet[str], signature: FolderSignature
+) -> Optional[Tuple[bytes, Optional[bytes]]]:
+    with _CACHE_LOCK:
+        cached = cache.responses.get(sections)
+    if cached is not None and cached[0] == signature:
+        return cached[1], cached[2]
+    return None
+
+
+def reviews_response_body(
+    folder: Path, sections: FrozenSet[str] = REVIEW_SECTIONS
+) -> Tuple[bytes, Optional[bytes]]:
+    signature = folder_signature(folder)
+    cache = _folder_cache(folder)
+    cached = _cached_response(cache, sections, signature)
+    if cached is not None:
+        return cached
+
+    with cache.build_lock:
+        # Another request may have rebuilt the response while this one was waiting.
+        signature = folder_signature(folder)
+        cached = _cached_response(cache, sections, signature)
+        if cached is not None:
+            return cached
+
+        body = encode_json({"ok": True, "data": load_reviews_from_folder(folder, sections)})
+        gzipped = gzip_json(body)
+        with _CACHE_LOCK:
+            # Drop responses for other section sets that were built from an older folder state.
+            cache.responses = {k: v for k, v in cache.responses.items() if v[0] == signature}
+            cache.responses[sections] = (signature, body, gzipped)
+        return body, gzipped
+
+
 class AppHandler(SimpleHTTPRequestHandler):
     def __init__(self, *args, static_dir: Path, default_data_dir: Optional[Path], **kwargs):
         self.static_dir = static_dir
@@ -337,9 +718,23 @@ class AppHandler(SimpleHTTPRequestHandler):
         super().__init__(*args, directory=str(static_dir), **kwargs)
 
     def send_json(self, payload: Dict[str, object], status: HTTPStatus = HTTPStatus.OK) -> None:
-        body = json.dumps(payload).encode("utf-8")
+        self.send_json_bytes(encode_json(payload), status)
+
+    def send_json_bytes(
+        self, body: bytes, status: HTTPStatus = HTTPStatus.OK, gzipped: Optional[bytes] = None
+    ) -> None:
+        encoding = None
+        if accepts_gzip(self.headers.get("Accept-Encoding", "")):
+            if gzipped is None:
+                gzipped = gzip_json(body)
+            if gzipped is not None:
+                body, encoding = gzipped, "gzip"
+
         self.send_response(status)
         self.send_header("Content-Type", "application/json; charset=utf-8")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Vary", "Accept-Encoding")
         self.send_header("Content-Length", str(len(body)))
         self.send_header("Cache-Control", "no-store")
         self.end_headers()
@@ -348,7 +743,7 @@ class AppHandler(SimpleHTTPRequestHandler):
     def do_GET(self):
         parsed = urllib.parse.urlparse(self.path)
         if parsed.path == "/api/reviews":
-            query = urllib.parse.parse_qs(parsed.query)
+            query = urllib.parse.parse_qs(parsed.query, keep_blank_values=True)
             requested = query.get("dir", [""])[0].strip()
             folder = Path(requested) if requested else self.default_data_dir
             if folder is None:
@@ -365,8 +760,10 @@ class AppHandler(SimpleHTTPRequestHandler):
             folder = folder.resolve()
 
             try:
-                data = load_reviews_from_folder(folder)
-                self.send_json({"ok": True, "data": data})
+                fields = query.get("fields")
+                sections = parse_sections(fields[0]) if fields else REVIEW_SECTIONS
+                body, gzipped = reviews_response_body(folder, sections)
+                self.send_json_bytes(body, gzipped=gzipped)
             except Exception as exc:
                 self.send_json(
                     {
@@ -410,6 +807,7 @@ def main():
         return AppHandler(*h_args, static_dir=static_dir, default_data_dir=default_data_dir, **h_kwargs)
 
     server = ThreadingHTTPServer((args.host, args.port), handler_factory)
+    start_parse_pool()
     print(f"Serving on http://{args.host}:{args.port}")
     print(f"Default data directory: {default_data_dir if default_data_dir else '(none)'}")
     try:
@@ -418,6 +816,7 @@ def main():
         pass
     finally:
         server.server_close()
+        stop_parse_pool()
 
 
 if __name__ == "__main__":